@@ -0,0 +1,807 @@
+import errno
+import os
+import shutil
+import time
+from io import BytesIO
+from logging import getLogger
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from watchdog.events import DirCreatedEvent, FileCreatedEvent
+
+from fittrackee import db
+from fittrackee.workouts.models import Workout
+from fittrackee.workouts.services.sink_folder_service import (
+    DEFAULT_SPORT_ID,
+    ERROR_FOLDER_NAME,
+    PROCESSED_FOLDER_NAME,
+    SINK_FOLDER_NAME,
+    FileStorageMock,
+    SinkFolderWatcher,
+    WorkoutFileHandler,
+)
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+    from fittrackee.users.models import User
+    from fittrackee.workouts.models import Sport
+
+test_logger = getLogger("test logger")
+
+
+class SinkFolderTestCaseMixin:
+    @staticmethod
+    def create_sink_file(
+        app: "Flask", relative_path: str, content: str = "content"
+    ) -> str:
+        file_path = os.path.join(
+            app.config["UPLOAD_FOLDER"], SINK_FOLDER_NAME, relative_path
+        )
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+        return file_path
+
+    @staticmethod
+    def get_sink_subfolder_path(
+        app: "Flask", dest_type: str, username: str, filename: str
+    ) -> str:
+        return os.path.join(
+            app.config["UPLOAD_FOLDER"],
+            SINK_FOLDER_NAME,
+            dest_type,
+            username,
+            filename,
+        )
+
+
+class TestFileStorageMock(SinkFolderTestCaseMixin):
+    def test_it_opens_stream_only_when_accessed(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        file_storage = FileStorageMock(file_path, "workout.gpx")
+
+        assert file_storage._stream is None
+        assert file_storage.stream.read() == b"content"
+        assert file_storage.stream is file_storage._stream
+        file_storage.close()
+
+    def test_it_returns_file_content(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        file_storage = FileStorageMock(file_path, "workout.gpx")
+
+        assert file_storage.getvalue() == b"content"
+
+    def test_it_saves_file(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        file_storage = FileStorageMock(file_path, "workout.gpx")
+        dst = os.path.join(app.config["UPLOAD_FOLDER"], "workout.gpx")
+
+        file_storage.save(dst)
+
+        with open(dst, "rb") as f:
+            assert f.read() == b"content"
+
+    def test_it_saves_file_to_file_object(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        file_storage = FileStorageMock(file_path, "workout.gpx")
+        dst = BytesIO()
+
+        with patch.object(
+            shutil, "copyfileobj", wraps=shutil.copyfileobj
+        ) as copyfileobj_mock:
+            file_storage.save(dst, buffer_size=2)
+
+        copyfileobj_mock.assert_called_once_with(file_storage.stream, dst, 2)
+        assert dst.getvalue() == b"content"
+        file_storage.close()
+
+    def test_it_closes_stream(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        file_storage = FileStorageMock(file_path, "workout.gpx")
+        stream = file_storage.stream
+
+        file_storage.close()
+
+        assert stream.closed
+        assert file_storage._stream is None
+
+
+class TestWorkoutFileHandlerOnCreated(SinkFolderTestCaseMixin):
+    def test_it_does_not_queue_directory(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        sink_folder = os.path.join(
+            app.config["UPLOAD_FOLDER"], SINK_FOLDER_NAME
+        )
+
+        handler.on_created(DirCreatedEvent(os.path.join(sink_folder, "test")))
+
+        assert handler._queue.empty()
+
+    def test_it_does_not_queue_file_with_invalid_extension(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/.DS_Store")
+
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.empty()
+
+    @pytest.mark.parametrize(
+        "input_relative_path",
+        ["test/gpx", "test/workout.gpx.tmp", "te.st/fit", "test/.gpx"],
+    )
+    def test_it_does_not_queue_file_without_workout_extension(
+        self, app: "Flask", input_relative_path: str
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, input_relative_path)
+
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.empty()
+
+    @pytest.mark.parametrize("input_filename", ["workout.gpx", "workout.FIT"])
+    def test_it_queues_workout_file_whatever_extension_case(
+        self, app: "Flask", input_filename: str
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, f"test/{input_filename}")
+
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.get_nowait() == file_path
+
+    @pytest.mark.parametrize(
+        "input_relative_path",
+        [
+            f"{PROCESSED_FOLDER_NAME}/test/workout.gpx",
+            f"{ERROR_FOLDER_NAME}/test/workout.gpx",
+            "test/4/tmp/workout.gpx",
+        ],
+    )
+    def test_it_does_not_queue_file_in_ignored_folder(
+        self, app: "Flask", input_relative_path: str
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, input_relative_path)
+
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.empty()
+
+    def test_it_queues_workout_file(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.get_nowait() == file_path
+        assert handler._queue.empty()
+
+    def test_it_does_not_queue_pending_file_twice(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        handler.on_created(FileCreatedEvent(file_path))
+        handler.on_created(FileCreatedEvent(file_path))
+
+        assert handler._queue.qsize() == 1
+
+
+class TestWorkoutFileHandlerProcessQueue(SinkFolderTestCaseMixin):
+    def test_it_processes_queued_files_until_shutdown(
+        self,
+        app: "Flask",
+        user_1: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        for index in range(2):
+            handler.handle_file(
+                self.create_sink_file(
+                    app, f"{user_1.username}/workout_{index}.gpx", gpx_file
+                )
+            )
+        handler._queue.put(None)
+
+        with patch.object(
+            handler, "_process_files", wraps=handler._process_files
+        ) as process_files_mock:
+            handler._process_queue()
+
+        process_files_mock.assert_called_once()
+        assert Workout.query.filter_by(user_id=user_1.id).count() == 2
+        assert handler._pending_files == set()
+
+
+class TestWorkoutFileHandlerWaitForFilesToBeWritten(SinkFolderTestCaseMixin):
+    def test_it_does_not_return_deleted_files(self, app: "Flask") -> None:
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        deleted_file_path = self.create_sink_file(app, "test/deleted.gpx")
+        os.remove(deleted_file_path)
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.time.sleep"
+        ):
+            result = WorkoutFileHandler._wait_for_files_to_be_written(
+                [deleted_file_path, file_path]
+            )
+
+        assert result == [file_path]
+
+    def test_it_checks_sizes_of_all_files_at_each_interval(
+        self, app: "Flask"
+    ) -> None:
+        file_paths = [
+            self.create_sink_file(app, "test/workout.gpx"),
+            self.create_sink_file(app, "test/workout.fit"),
+        ]
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.time.sleep"
+        ) as sleep_mock:
+            result = WorkoutFileHandler._wait_for_files_to_be_written(
+                file_paths
+            )
+
+        assert result == file_paths
+        sleep_mock.assert_called_once()
+
+
+class TestWorkoutFileHandlerParseFilePath:
+    @pytest.mark.parametrize(
+        "input_description, input_relative_path, expected_sport_id",
+        [
+            ("without sport", "test/workout.gpx", DEFAULT_SPORT_ID),
+            ("with sport", "test/4/workout.gpx", 4),
+            ("with non-numeric folder", "test/tmp/a.gpx", DEFAULT_SPORT_ID),
+            ("with negative number", "test/-4/a.gpx", DEFAULT_SPORT_ID),
+            ("with superscript digit", "test/\u00b2/a.gpx", DEFAULT_SPORT_ID),
+            ("with nested folders", "test/4/tmp/a.gpx", DEFAULT_SPORT_ID),
+        ],
+    )
+    def test_it_returns_username_and_sport_id(
+        self,
+        app: "Flask",
+        input_description: str,
+        input_relative_path: str,
+        expected_sport_id: int,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = os.path.join(
+            app.config["UPLOAD_FOLDER"], SINK_FOLDER_NAME, input_relative_path
+        )
+
+        assert handler._parse_file_path(file_path) == (
+            "test",
+            expected_sport_id,
+        )
+
+    def test_it_raises_error_when_file_is_not_in_sink_folder(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = os.path.join(
+            app.config["UPLOAD_FOLDER"], "test", "workout.gpx"
+        )
+
+        with pytest.raises(ValueError, match="'sink' not found in path"):
+            handler._parse_file_path(file_path)
+
+    def test_it_raises_error_when_file_is_not_in_user_folder(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = os.path.join(
+            app.config["UPLOAD_FOLDER"], SINK_FOLDER_NAME, "workout.gpx"
+        )
+
+        with pytest.raises(ValueError, match="Invalid path structure"):
+            handler._parse_file_path(file_path)
+
+
+class TestWorkoutFileHandlerProcessFile(SinkFolderTestCaseMixin):
+    def test_it_creates_workout_and_moves_file_to_processed_folder(
+        self,
+        app: "Flask",
+        user_1: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(
+            app, f"{user_1.username}/workout.gpx", gpx_file
+        )
+        # instances are detached from session once file is processed
+        user_1_id, username = user_1.id, user_1.username
+        sport_id = sport_1_cycling.id
+
+        handler._process_files([file_path])
+
+        workout = Workout.query.one()
+        assert workout.user_id == user_1_id
+        assert workout.sport_id == sport_id
+        assert not os.path.exists(file_path)
+        assert os.path.exists(
+            self.get_sink_subfolder_path(
+                app, PROCESSED_FOLDER_NAME, username, "workout.gpx"
+            )
+        )
+
+    def test_it_moves_file_to_error_folder_when_user_does_not_exist(
+        self,
+        app: "Flask",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "unknown/workout.gpx", gpx_file)
+
+        handler._process_files([file_path])
+
+        assert Workout.query.count() == 0
+        assert not os.path.exists(file_path)
+        assert os.path.exists(
+            self.get_sink_subfolder_path(
+                app, ERROR_FOLDER_NAME, "unknown", "workout.gpx"
+            )
+        )
+
+    def test_it_moves_file_to_error_folder_when_sport_does_not_exist(
+        self,
+        app: "Flask",
+        user_1: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(
+            app, f"{user_1.username}/2/workout.gpx", gpx_file
+        )
+        username = user_1.username
+
+        handler._process_files([file_path])
+
+        assert Workout.query.count() == 0
+        error_file_path = self.get_sink_subfolder_path(
+            app, ERROR_FOLDER_NAME, username, "workout.gpx.error"
+        )
+        with open(error_file_path) as f:
+            assert "Error: Sport ID 2 not found" in f.read()
+
+
+class TestWorkoutFileHandlerProcessFiles(SinkFolderTestCaseMixin):
+    def test_it_fetches_users_once_for_all_files(
+        self,
+        app: "Flask",
+        user_1: "User",
+        user_2: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_paths = [
+            self.create_sink_file(
+                app, f"{user.username}/workout_{index}.gpx", gpx_file
+            )
+            for index, user in enumerate([user_1, user_1, user_2])
+        ]
+
+        user_1_id, user_2_id = user_1.id, user_2.id
+        usernames = {user_1.username, user_2.username}
+
+        with patch.object(
+            handler, "_get_users", wraps=handler._get_users
+        ) as get_users_mock:
+            handler._process_files(file_paths)
+
+        get_users_mock.assert_called_once_with(usernames)
+        assert Workout.query.filter_by(user_id=user_1_id).count() == 2
+        assert Workout.query.filter_by(user_id=user_2_id).count() == 1
+
+    def test_it_empties_session_after_each_file(
+        self,
+        app: "Flask",
+        user_1: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_paths = [
+            self.create_sink_file(
+                app, f"{user_1.username}/workout_{index}.gpx", gpx_file
+            )
+            for index in range(2)
+        ]
+        user_1_id = user_1.id
+
+        with patch.object(
+            db.session, "expunge_all", wraps=db.session.expunge_all
+        ) as expunge_all_mock:
+            handler._process_files(file_paths)
+
+        assert expunge_all_mock.call_count == 2
+        assert len(db.session.identity_map) == 0
+        assert Workout.query.filter_by(user_id=user_1_id).count() == 2
+
+
+class TestSinkFolderWatcherStart(SinkFolderTestCaseMixin):
+    def test_it_watches_many_users_folders_with_a_single_emitter(
+        self, app: "Flask"
+    ) -> None:
+        watcher = SinkFolderWatcher(app, test_logger)
+        for index in range(150):
+            os.makedirs(
+                os.path.join(
+                    watcher.get_sink_folder_path(), f"user_{index}", "4"
+                )
+            )
+
+        with patch.object(
+            WorkoutFileHandler, "_process_batch"
+        ) as process_batch_mock:
+            watcher.start()
+            try:
+                assert watcher.observer
+                assert len(watcher.observer.emitters) == 1
+                file_path = self.create_sink_file(
+                    app, "user_149/4/workout.gpx"
+                )
+                for _ in range(50):
+                    if process_batch_mock.called:
+                        break
+                    time.sleep(0.1)
+            finally:
+                watcher.stop()
+
+        process_batch_mock.assert_called_once_with([file_path])
+
+
+class TestSinkFolderWatcherStop:
+    def test_it_stops_watcher_when_observer_failed_to_start(
+        self, app: "Flask"
+    ) -> None:
+        watcher = SinkFolderWatcher(app, test_logger)
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.Observer.start",
+            side_effect=OSError(errno.EMFILE, "instance limit reached"),
+        ):
+            with pytest.raises(OSError, match="instance limit reached"):
+                watcher.start()
+
+        watcher.stop()
+
+        assert watcher.observer is None
+        assert watcher.event_handler is None
+
+
+class TestWorkoutFileHandlerMoveFile(SinkFolderTestCaseMixin):
+    def test_it_moves_file_to_destination_folder(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        handler._move_to_processed(file_path, "test")
+
+        assert not os.path.exists(file_path)
+        assert os.path.exists(
+            self.get_sink_subfolder_path(
+                app, PROCESSED_FOLDER_NAME, "test", "workout.gpx"
+            )
+        )
+
+    def test_it_does_not_overwrite_existing_file(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        existing_file_path = self.create_sink_file(
+            app, f"{PROCESSED_FOLDER_NAME}/test/workout.gpx", "existing"
+        )
+        file_path = self.create_sink_file(app, "test/workout.gpx", "new")
+
+        handler._move_to_processed(file_path, "test")
+
+        assert not os.path.exists(file_path)
+        with open(existing_file_path) as f:
+            assert f.read() == "existing"
+        processed_files = os.listdir(os.path.dirname(existing_file_path))
+        assert len(processed_files) == 2
+
+    def test_it_does_not_overwrite_files_with_same_name_moved_in_same_second(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_paths = [
+            self.create_sink_file(app, relative_path, relative_path)
+            for relative_path in [
+                "test/workout.gpx",
+                "test/4/workout.gpx",
+                "test/5/workout.gpx",
+            ]
+        ]
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.datetime"
+        ) as datetime_mock:
+            datetime_mock.now.return_value.strftime.return_value = (
+                "20260101_120000"
+            )
+            for file_path in file_paths:
+                handler._move_to_processed(file_path, "test")
+
+        for file_path in file_paths:
+            assert not os.path.exists(file_path)
+        processed_folder = os.path.join(
+            app.config["UPLOAD_FOLDER"],
+            SINK_FOLDER_NAME,
+            PROCESSED_FOLDER_NAME,
+            "test",
+        )
+        assert sorted(os.listdir(processed_folder)) == [
+            "workout.gpx",
+            "workout_20260101_120000.gpx",
+            "workout_20260101_120000_1.gpx",
+        ]
+        with open(
+            os.path.join(processed_folder, "workout_20260101_120000_1.gpx")
+        ) as f:
+            assert f.read() == "test/5/workout.gpx"
+
+    def test_it_creates_destination_folder_once(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_paths = [
+            self.create_sink_file(app, f"test/workout_{index}.gpx")
+            for index in range(2)
+        ]
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.os.makedirs",
+            wraps=os.makedirs,
+        ) as makedirs_mock:
+            for file_path in file_paths:
+                handler._move_to_processed(file_path, "test")
+
+        makedirs_mock.assert_called_once()
+        for index in range(2):
+            assert os.path.exists(
+                self.get_sink_subfolder_path(
+                    app, PROCESSED_FOLDER_NAME, "test", f"workout_{index}.gpx"
+                )
+            )
+
+    def test_it_recreates_destination_folder_when_deleted(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        other_file_path = self.create_sink_file(app, "test/other.gpx")
+        handler._move_to_processed(file_path, "test")
+        processed_folder = os.path.join(
+            app.config["UPLOAD_FOLDER"],
+            SINK_FOLDER_NAME,
+            PROCESSED_FOLDER_NAME,
+            "test",
+        )
+        shutil.rmtree(processed_folder)
+
+        handler._move_to_processed(other_file_path, "test")
+
+        assert os.listdir(processed_folder) == ["other.gpx"]
+
+    def test_it_falls_back_to_shutil_move_across_filesystems(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        with (
+            patch(
+                "fittrackee.workouts.services.sink_folder_service.os.link",
+                side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+            ),
+            patch(
+                "fittrackee.workouts.services.sink_folder_service.shutil.move"
+            ) as move_mock,
+        ):
+            handler._move_to_processed(file_path, "test")
+
+        move_mock.assert_called_once_with(
+            file_path,
+            self.get_sink_subfolder_path(
+                app, PROCESSED_FOLDER_NAME, "test", "workout.gpx"
+            ),
+        )
+
+    def test_it_does_not_overwrite_existing_file_when_hard_links_are_not_supported(  # noqa
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        existing_file_path = self.create_sink_file(
+            app, f"{PROCESSED_FOLDER_NAME}/test/workout.gpx", "existing"
+        )
+        file_path = self.create_sink_file(app, "test/workout.gpx", "new")
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.os.link",
+            side_effect=OSError(errno.EPERM, "Operation not permitted"),
+        ):
+            handler._move_to_processed(file_path, "test")
+
+        assert not os.path.exists(file_path)
+        with open(existing_file_path) as f:
+            assert f.read() == "existing"
+        processed_files = os.listdir(os.path.dirname(existing_file_path))
+        assert len(processed_files) == 2
+
+    def test_it_removes_destination_link_when_source_can_not_be_removed(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+        dest_path = self.get_sink_subfolder_path(
+            app, PROCESSED_FOLDER_NAME, "test", "workout.gpx"
+        )
+
+        unlink = os.unlink
+
+        def unlink_except_source(path: str) -> None:
+            if path == file_path:
+                raise PermissionError(errno.EACCES, "Permission denied")
+            unlink(path)
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.os.unlink",
+            side_effect=unlink_except_source,
+        ):
+            handler._move_to_processed(file_path, "test")
+
+        assert os.path.exists(file_path)
+        assert not os.path.exists(dest_path)
+
+    def test_it_keeps_file_when_move_fails(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        with patch(
+            "fittrackee.workouts.services.sink_folder_service.os.link",
+            side_effect=PermissionError(errno.EACCES, "Permission denied"),
+        ):
+            handler._move_to_processed(file_path, "test")
+
+        assert os.path.exists(file_path)
+
+
+class TestWorkoutFileHandlerMoveToError(SinkFolderTestCaseMixin):
+    def test_it_moves_file_and_writes_error_file(self, app: "Flask") -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "test/workout.gpx")
+
+        handler._move_to_error(file_path, "some error", "test")
+
+        assert not os.path.exists(file_path)
+        assert os.path.exists(
+            self.get_sink_subfolder_path(
+                app, ERROR_FOLDER_NAME, "test", "workout.gpx"
+            )
+        )
+        with open(
+            self.get_sink_subfolder_path(
+                app, ERROR_FOLDER_NAME, "test", "workout.gpx.error"
+            )
+        ) as f:
+            content = f.read()
+        assert content.startswith("Timestamp: ")
+        assert content.endswith("\nError: some error\n")
+
+    def test_it_writes_error_file_for_each_file_with_same_name(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_paths = [
+            self.create_sink_file(app, relative_path)
+            for relative_path in [
+                "test/workout.gpx",
+                "test/4/workout.gpx",
+                "test/5/workout.gpx",
+            ]
+        ]
+
+        for index, file_path in enumerate(file_paths):
+            handler._move_to_error(file_path, f"error {index}", "test")
+
+        error_folder = os.path.join(
+            app.config["UPLOAD_FOLDER"],
+            SINK_FOLDER_NAME,
+            ERROR_FOLDER_NAME,
+            "test",
+        )
+        moved_files = [
+            filename
+            for filename in os.listdir(error_folder)
+            if not filename.endswith(".error")
+        ]
+        assert len(moved_files) == 3
+        error_messages = set()
+        for filename in moved_files:
+            with open(os.path.join(error_folder, f"{filename}.error")) as f:
+                error_messages.add(f.read().rsplit("Error: ", 1)[1])
+        assert error_messages == {"error 0\n", "error 1\n", "error 2\n"}
+        assert len(os.listdir(error_folder)) == 6
+
+    def test_it_moves_file_to_unknown_folder_when_no_username_provided(
+        self, app: "Flask"
+    ) -> None:
+        handler = WorkoutFileHandler(app, test_logger)
+        file_path = self.create_sink_file(app, "workout.gpx")
+
+        handler._move_to_error(file_path, "some error")
+
+        assert os.path.exists(
+            self.get_sink_subfolder_path(
+                app, ERROR_FOLDER_NAME, "unknown", "workout.gpx"
+            )
+        )
+
+
+class TestSinkFolderWatcherProcessExistingFiles(SinkFolderTestCaseMixin):
+    def test_it_returns_0_when_no_files(self, app: "Flask") -> None:
+        watcher = SinkFolderWatcher(app, test_logger)
+        watcher.setup_folders()
+
+        assert watcher.process_existing_files() == 0
+
+    def test_it_processes_workout_files_outside_processed_and_error_folders(
+        self, app: "Flask"
+    ) -> None:
+        watcher = SinkFolderWatcher(app, test_logger)
+        expected_file_paths = [
+            self.create_sink_file(app, "test/workout.gpx"),
+            self.create_sink_file(app, "test/4/workout.fit"),
+        ]
+        self.create_sink_file(app, "test/notes.txt")
+        self.create_sink_file(app, f"{PROCESSED_FOLDER_NAME}/test/workout.gpx")
+        self.create_sink_file(app, f"{ERROR_FOLDER_NAME}/test/workout.gpx")
+
+        with patch.object(
+            WorkoutFileHandler, "_process_files"
+        ) as process_files_mock:
+            count = watcher.process_existing_files()
+
+        assert count == 2
+        process_files_mock.assert_called_once()
+        assert sorted(process_files_mock.call_args.args[0]) == sorted(
+            expected_file_paths
+        )
+
+    def test_it_creates_workouts_from_existing_files(
+        self,
+        app: "Flask",
+        user_1: "User",
+        user_2: "User",
+        sport_1_cycling: "Sport",
+        gpx_file: str,
+    ) -> None:
+        watcher = SinkFolderWatcher(app, test_logger)
+        for index, user in enumerate([user_1, user_1, user_2]):
+            self.create_sink_file(
+                app, f"{user.username}/workout_{index}.gpx", gpx_file
+            )
+
+        count = watcher.process_existing_files()
+
+        assert count == 3
+        assert Workout.query.filter_by(user_id=user_1.id).count() == 2
+        assert Workout.query.filter_by(user_id=user_2.id).count() == 1
+        assert (
+            os.listdir(
+                os.path.join(
+                    app.config["UPLOAD_FOLDER"],
+                    SINK_FOLDER_NAME,
+                    user_1.username,
+                )
+            )
+            == []
+        )
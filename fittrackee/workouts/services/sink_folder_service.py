@@ -17,16 +17,28 @@ After processing:
     - Failed files are moved to UPLOAD_FOLDER/sink/error/
 """
 
+import errno
 import os
 import shutil
 import time
 from datetime import datetime, timezone
-from io import BytesIO
 from logging import Logger, getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
-
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from fittrackee import db
@@ -34,106 +46,304 @@ from fittrackee.files import get_absolute_file_path
 from fittrackee.users.models import User
 from fittrackee.workouts.constants import WORKOUT_ALLOWED_EXTENSIONS
 from fittrackee.workouts.models import Sport
+from fittrackee.workouts.services.workouts_from_file_creation_service import (
+    WorkoutsFromFileCreationService,
+)
 
 if TYPE_CHECKING:
     from flask import Flask
+    from watchdog.observers.api import BaseObserver
 
 DEFAULT_SPORT_ID = 1  # Cycling
 SINK_FOLDER_NAME = "sink"
 PROCESSED_FOLDER_NAME = "processed"
 ERROR_FOLDER_NAME = "error"
+SINK_ALLOWED_EXTENSIONS = frozenset(WORKOUT_ALLOWED_EXTENSIONS)
+# polling used to wait for a new file to be fully written
+FILE_STABILITY_CHECK_INTERVAL = 0.05  # in seconds
+FILE_STABILITY_MAX_CHECKS = 40
+# created files are processed in batches
+BATCH_TIMEOUT = 0.2  # in seconds
+MAX_BATCH_SIZE = 50
+# created files are ignored in processed and error folders and when deeper
+# than sports folders (sink/{username}/{sport_id}/file)
+MAX_CREATED_FILE_DEPTH = 3
+IGNORED_FOLDER_NAMES = {os.pardir, PROCESSED_FOLDER_NAME, ERROR_FOLDER_NAME}
+
+# errors raised by os.link when hard links can not be used
+LINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EMLINK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+}
 
 appLog = getLogger("fittrackee_sink_folder")
 
 
+def _is_workout_file(filename: str) -> bool:
+    """
+    Check file extension, ignoring hidden files without name (for
+    instance '.gpx').
+    """
+    name, _, extension = filename.rpartition(".")
+    return bool(name) and extension.lower() in SINK_ALLOWED_EXTENSIONS
+
+
+class FileStorageMock:
+    """
+    File-like object that mimics werkzeug FileStorage.
+
+    It is backed by the file path, to avoid loading the whole file in
+    memory.
+    """
+
+    def __init__(self, path: str, filename: str):
+        self._path = path
+        self._stream: Optional[IO[bytes]] = None
+        self.filename = filename
+
+    @property
+    def stream(self) -> IO[bytes]:
+        if self._stream is None:
+            self._stream = open(self._path, "rb")
+        return self._stream
+
+    def getvalue(self) -> bytes:
+        return Path(self._path).read_bytes()
+
+    def save(
+        self,
+        dst: Union[str, "os.PathLike[str]", IO[bytes]],
+        buffer_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        Save file to a path or a file object, without loading the whole
+        file in memory.
+        """
+        if isinstance(dst, (str, os.PathLike)):
+            # copy can be performed by the kernel (sendfile on Linux)
+            shutil.copyfile(self._path, dst)
+            return
+        self.stream.seek(0)
+        shutil.copyfileobj(self.stream, dst, buffer_size)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
 class WorkoutFileHandler(FileSystemEventHandler):
     """Handler for file system events in the sink folder."""
 
     def __init__(self, app: "Flask", logger: Logger):
         self.app = app
         self.logger = logger
+        # files are queued by observer thread and processed in batches by
+        # a worker thread
+        self._queue: "Queue[Optional[str]]" = Queue()
+        self._worker: Optional[Thread] = None
+        self._pending_files: Set[str] = set()
+        self._pending_files_lock = Lock()
+        self._sport_ids: Optional[Set[int]] = None
+        # paths do not change while the handler is running
+        self._sink_folder = os.path.join(
+            app.config["UPLOAD_FOLDER"], SINK_FOLDER_NAME
+        )
+        self._processed_root = os.path.join(
+            self._sink_folder, PROCESSED_FOLDER_NAME
+        )
+        self._error_root = os.path.join(self._sink_folder, ERROR_FOLDER_NAME)
+        self._ensured_dirs: Set[str] = set()
         super().__init__()
 
-    def on_created(self, event: FileCreatedEvent) -> None:
+    def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
         if event.is_directory:
             return
 
-        file_path = event.src_path
+        self.handle_file(os.fsdecode(event.src_path))
 
+    def handle_file(self, file_path: str) -> None:
+        """Submit a file to be processed if it is a workout file."""
         # Only process workout files
-        extension = Path(file_path).suffix.lower().lstrip(".")
-        if extension not in WORKOUT_ALLOWED_EXTENSIONS:
+        if not _is_workout_file(os.path.basename(file_path)):
             return
 
-        # Wait a moment for file to be fully written
-        time.sleep(0.5)
+        # the whole sink folder is watched, including processed and error
+        # folders
+        parts = self._get_relative_path_parts(file_path)
+        if (
+            parts[0] in IGNORED_FOLDER_NAMES
+            or len(parts) > MAX_CREATED_FILE_DEPTH
+        ):
+            return
 
-        with self.app.app_context():
-            self._process_file(file_path)
+        # a file can be reported twice when its folder has just been
+        # created (folder creation event and events generated by folder scan)
+        with self._pending_files_lock:
+            if file_path in self._pending_files:
+                return
+            self._pending_files.add(file_path)
 
-    def _process_file(self, file_path: str) -> None:
-        """Process a single workout file from the sink folder."""
-        from fittrackee.workouts.services.workouts_from_file_creation_service import (
-            WorkoutsFromFileCreationService,
+        self._queue.put(file_path)
+
+    def start(self) -> None:
+        """Start the worker processing queued files."""
+        self._worker = Thread(
+            target=self._process_queue, name="sink_folder_worker", daemon=True
         )
+        self._worker.start()
+
+    def shutdown(self) -> None:
+        """Wait for queued files to be processed and stop the worker."""
+        if self._worker:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def _process_queue(self) -> None:
+        """Process queued files in batches until shutdown (run in worker)."""
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get(timeout=BATCH_TIMEOUT))
+                except Empty:
+                    break
+
+            if None in batch:
+                stopped = True
+            file_paths = [
+                file_path for file_path in batch if file_path is not None
+            ]
+            if file_paths:
+                self._process_batch(file_paths)
+
+    def _process_batch(self, file_paths: List[str]) -> None:
+        """Process files once fully written, within a single app context."""
+        try:
+            existing_file_paths = self._wait_for_files_to_be_written(
+                file_paths
+            )
+            for file_path in set(file_paths) - set(existing_file_paths):
+                self.logger.warning("File no longer exists: %s", file_path)
+
+            if existing_file_paths:
+                with self.app.app_context():
+                    self._process_files(existing_file_paths)
+        except Exception as e:
+            self.logger.exception("Error processing files: %s", e)
+        finally:
+            with self._pending_files_lock:
+                self._pending_files.difference_update(file_paths)
+
+    @staticmethod
+    def _wait_for_files_to_be_written(file_paths: List[str]) -> List[str]:
+        """
+        Wait until files sizes are stable between two checks.
+
+        Returns files that still exist, in the same order.
+        """
+        previous_sizes: Dict[str, int] = {}
+        unstable_file_paths = list(file_paths)
+        deleted_file_paths = set()
+        for _ in range(FILE_STABILITY_MAX_CHECKS):
+            for file_path in list(unstable_file_paths):
+                try:
+                    size = os.stat(file_path).st_size
+                except FileNotFoundError:
+                    deleted_file_paths.add(file_path)
+                    unstable_file_paths.remove(file_path)
+                    continue
+                if size == previous_sizes.get(file_path) and size > 0:
+                    unstable_file_paths.remove(file_path)
+                previous_sizes[file_path] = size
+            if not unstable_file_paths:
+                break
+            time.sleep(FILE_STABILITY_CHECK_INTERVAL)
+        return [
+            file_path
+            for file_path in file_paths
+            if file_path not in deleted_file_paths
+        ]
+
+    def _process_files(self, file_paths: List[str]) -> None:
+        """
+        Process several workout files from the sink folder.
 
+        Users are fetched with a single query for all files.
+
+        Files are processed sequentially, since records update relies on
+        session event listeners that are not thread-safe.
+        """
+        parsed_paths: Dict[str, Tuple[str, int]] = {}
+        for file_path in file_paths:
+            parsed_path = self._get_parsed_path(file_path)
+            if parsed_path is not None:
+                parsed_paths[file_path] = parsed_path
+
+        users = self._get_users(
+            {username for username, _ in parsed_paths.values()}
+        )
+
+        for file_path, (username, sport_id) in parsed_paths.items():
+            try:
+                self._process_file_cached(
+                    file_path, username, users.get(username), sport_id
+                )
+            finally:
+                # keep session identity map small on large batches
+                db.session.expunge_all()
+
+    def _process_file_cached(
+        self,
+        file_path: str,
+        username: str,
+        user: Optional[User],
+        sport_id: int,
+    ) -> None:
+        """
+        Process a single workout file from the sink folder, user being
+        already fetched from database.
+        """
         file_path_obj = Path(file_path)
         filename = file_path_obj.name
 
-        self.logger.info(f"Processing file: {file_path}")
+        self.logger.info("Processing file: %s", file_path)
 
-        # Parse the path to get username and sport
-        try:
-            user, sport_id = self._parse_file_path(file_path)
-        except Exception as e:
-            self.logger.error(f"Failed to parse file path: {e}")
-            self._move_to_error(file_path, str(e))
-            return
-
-        if not user:
-            self.logger.error(f"Could not determine user for file: {file_path}")
-            self._move_to_error(file_path, "Could not determine user")
+        if user:
+            # user may have been detached from session by a previous file
+            user = db.session.merge(user, load=False)
+        else:
+            self.logger.error(
+                "Could not determine user for file: %s", file_path
+            )
+            self._move_to_error(
+                file_path, "Could not determine user", username
+            )
             return
 
         # Verify sport exists
-        sport = Sport.query.filter_by(id=sport_id).first()
-        if not sport:
-            self.logger.error(f"Sport ID {sport_id} not found")
-            self._move_to_error(file_path, f"Sport ID {sport_id} not found")
+        if sport_id not in self._get_sport_ids():
+            self.logger.error("Sport ID %s not found", sport_id)
+            self._move_to_error(
+                file_path, f"Sport ID {sport_id} not found", username
+            )
             return
 
         # Check if user is active
         if user.suspended_at:
-            self.logger.error(f"User {user.username} is suspended")
-            self._move_to_error(file_path, f"User {user.username} is suspended")
-            return
-
-        # Read file content
-        try:
-            with open(file_path, "rb") as f:
-                file_content = BytesIO(f.read())
-        except Exception as e:
-            self.logger.error(f"Failed to read file: {e}")
-            self._move_to_error(file_path, str(e))
+            self.logger.error("User %s is suspended", user.username)
+            self._move_to_error(
+                file_path, f"User {user.username} is suspended", username
+            )
             return
 
-        # Create a file-like object that mimics werkzeug FileStorage
-        class FileStorageMock:
-            def __init__(self, stream: BytesIO, filename: str):
-                self.stream = stream
-                self.filename = filename
-
-            def getvalue(self) -> bytes:
-                self.stream.seek(0)
-                return self.stream.read()
-
-            def save(self, dst: str) -> None:
-                self.stream.seek(0)
-                with open(dst, "wb") as f:
-                    f.write(self.stream.read())
-
-        file_storage = FileStorageMock(file_content, filename)
+        file_storage = FileStorageMock(file_path, filename)
 
         # Prepare workout data
         workouts_data = {
@@ -151,26 +361,43 @@ class WorkoutFileHandler(FileSystemEventHandler):
                 workouts_data=workouts_data,
                 file=file_storage,  # type: ignore
             )
-            workouts, processing_output = service.process()
+            try:
+                workouts, processing_output = service.process()
+            finally:
+                # file must be closed before being moved
+                file_storage.close()
 
             if workouts:
                 workout = workouts[0]
                 self.logger.info(
-                    f"Successfully imported workout for user {user.username}: "
-                    f"{workout.short_id} ({workout.sport.label})"
+                    "Successfully imported workout for user %s: %s (%s)",
+                    user.username,
+                    workout.short_id,
+                    workout.sport.label,
                 )
                 self._move_to_processed(file_path, user.username)
             else:
                 error_msg = processing_output.get("errored_workouts", {})
-                self.logger.error(f"Failed to create workout: {error_msg}")
-                self._move_to_error(file_path, str(error_msg))
+                self.logger.error("Failed to create workout: %s", error_msg)
+                self._move_to_error(file_path, str(error_msg), username)
 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Error processing workout: {e}")
+            self.logger.error("Error processing workout: %s", e)
+            self._move_to_error(file_path, str(e), username)
+
+    def _get_parsed_path(self, file_path: str) -> Optional[Tuple[str, int]]:
+        """
+        Parse the file path, moving the file to the error folder on failure.
+        """
+        try:
+            return self._parse_file_path(file_path)
+        except Exception as e:
+            self.logger.error("Failed to parse file path: %s", e)
             self._move_to_error(file_path, str(e))
+            return None
 
-    def _parse_file_path(self, file_path: str) -> tuple[Optional[User], int]:
+    def _parse_file_path(self, file_path: str) -> Tuple[str, int]:
         """
         Parse the file path to extract username and sport ID.
 
@@ -178,17 +405,10 @@ class WorkoutFileHandler(FileSystemEventHandler):
             .../sink/{username}/file.fit -> default sport
             .../sink/{username}/{sport_id}/file.fit -> specific sport
         """
-        file_path_obj = Path(file_path)
-        parts = file_path_obj.parts
-
-        # Find the 'sink' folder in the path
-        try:
-            sink_index = parts.index(SINK_FOLDER_NAME)
-        except ValueError:
+        remaining_parts = self._get_relative_path_parts(file_path)
+        if remaining_parts[0] == os.pardir:
             raise ValueError(f"'{SINK_FOLDER_NAME}' not found in path")
 
-        remaining_parts = parts[sink_index + 1:]
-
         if len(remaining_parts) < 2:
             raise ValueError(
                 f"Invalid path structure. Expected: sink/username/file or "
@@ -204,87 +424,186 @@ class WorkoutFileHandler(FileSystemEventHandler):
             sport_id = DEFAULT_SPORT_ID
         elif len(remaining_parts) == 3:
             # sink/username/sport_id/file.fit
-            try:
-                sport_id = int(remaining_parts[1])
-            except ValueError:
-                # Not a number, treat as part of filename structure
-                sport_id = DEFAULT_SPORT_ID
+            # (if not a number, treat as part of filename structure)
+            sport_folder = remaining_parts[1]
+            sport_id = (
+                int(sport_folder)
+                if sport_folder.isdecimal()
+                else DEFAULT_SPORT_ID
+            )
         else:
             sport_id = DEFAULT_SPORT_ID
 
-        # Get user from database
-        user = User.query.filter_by(username=username).first()
+        return username, sport_id
 
-        return user, sport_id
+    def _get_relative_path_parts(self, file_path: str) -> List[str]:
+        """Split the file path relative to the sink folder."""
+        return os.path.relpath(file_path, self._sink_folder).split(os.sep)
 
-    def _get_sink_folder(self) -> str:
-        """Get the base sink folder path."""
-        upload_folder = self.app.config["UPLOAD_FOLDER"]
-        return os.path.join(upload_folder, SINK_FOLDER_NAME)
+    @staticmethod
+    def _get_users(usernames: Set[str]) -> Dict[str, User]:
+        """Fetch users from database in one query."""
+        if not usernames:
+            return {}
+        return {
+            user.username: user
+            for user in User.query.filter(User.username.in_(usernames)).all()
+        }
+
+    def _get_sport_ids(self) -> Set[int]:
+        """
+        Get existing sport ids.
+
+        Sports are not created at runtime, so they are fetched only once.
+        """
+        if self._sport_ids is None:
+            self._sport_ids = {
+                sport_id for (sport_id,) in db.session.query(Sport.id).all()
+            }
+        return self._sport_ids
 
     def _move_to_processed(self, file_path: str, username: str) -> None:
         """Move successfully processed file to the processed folder."""
-        self._move_file(
-            file_path,
-            PROCESSED_FOLDER_NAME,
-            username
-        )
+        self._move_file(file_path, self._processed_root, username)
 
-    def _move_to_error(self, file_path: str, error_msg: str) -> None:
-        """Move failed file to the error folder."""
-        # Extract username from path if possible
-        try:
-            parts = Path(file_path).parts
-            sink_index = parts.index(SINK_FOLDER_NAME)
-            username = parts[sink_index + 1] if len(parts) > sink_index + 1 else "unknown"
-        except (ValueError, IndexError):
-            username = "unknown"
+    def _move_to_error(
+        self, file_path: str, error_msg: str, username: str = "unknown"
+    ) -> None:
+        """
+        Move failed file to the error folder.
 
-        self._move_file(file_path, ERROR_FOLDER_NAME, username)
+        When the path cannot be parsed, the file is moved to the 'unknown'
+        subfolder.
+        The error message is written to a companion file named after the
+        moved file (which may have been renamed to avoid overwriting an
+        existing file).
+        """
+        dest_path = self._move_file(file_path, self._error_root, username)
 
         # Write error message to a companion file
-        error_file = file_path + ".error"
         try:
             timestamp = datetime.now(tz=timezone.utc).isoformat()
             error_content = f"Timestamp: {timestamp}\nError: {error_msg}\n"
 
-            # Get destination error file path
-            sink_folder = self._get_sink_folder()
-            dest_folder = os.path.join(sink_folder, ERROR_FOLDER_NAME, username)
-            os.makedirs(dest_folder, exist_ok=True)
-
-            filename = Path(file_path).name
-            error_dest = os.path.join(dest_folder, filename + ".error")
+            # Get destination error file path (folder is created when
+            # moving file)
+            if dest_path is None:
+                dest_path = os.path.join(
+                    self._error_root, username, Path(file_path).name
+                )
+            error_dest = dest_path + ".error"
 
-            with open(error_dest, "w") as f:
-                f.write(error_content)
+            # small file written at once, without buffered text layer
+            fd = os.open(
+                error_dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+            )
+            try:
+                os.write(fd, error_content.encode())
+            finally:
+                os.close(fd)
         except Exception as e:
-            self.logger.warning(f"Failed to write error file: {e}")
+            self.logger.warning("Failed to write error file: %s", e)
 
-    def _move_file(self, file_path: str, dest_type: str, username: str) -> None:
-        """Move a file to the specified destination folder."""
-        sink_folder = self._get_sink_folder()
-        dest_folder = os.path.join(sink_folder, dest_type, username)
+    def _move_file(
+        self, file_path: str, dest_root: str, username: str
+    ) -> Optional[str]:
+        """
+        Move a file to the specified destination folder.
+
+        Returns the destination path, or None if the file can not be moved.
+        """
+        dest_folder = os.path.join(dest_root, username)
 
         # Create destination folder if it doesn't exist
-        os.makedirs(dest_folder, exist_ok=True)
+        self._ensure_directory(dest_folder)
 
-        # Generate unique filename if file already exists
-        filename = Path(file_path).name
-        dest_path = os.path.join(dest_folder, filename)
+        try:
+            try:
+                dest_path = self._move_file_to_folder(file_path, dest_folder)
+            except FileNotFoundError:
+                if os.path.isdir(dest_folder):
+                    raise
+                # destination folder has been deleted since its creation
+                self._ensured_dirs.discard(dest_folder)
+                self._ensure_directory(dest_folder)
+                dest_path = self._move_file_to_folder(file_path, dest_folder)
+            self.logger.debug("Moved %s to %s", file_path, dest_path)
+            return dest_path
+        except Exception as e:
+            self.logger.error("Failed to move file %s: %s", file_path, e)
+            return None
 
-        if os.path.exists(dest_path):
-            # Add timestamp to filename
-            timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
-            name, ext = os.path.splitext(filename)
-            filename = f"{name}_{timestamp}{ext}"
-            dest_path = os.path.join(dest_folder, filename)
+    def _move_file_to_folder(self, file_path: str, dest_folder: str) -> str:
+        """
+        Move file to folder without overwriting an existing file.
 
+        Returns the destination path.
+        """
+        filename = os.path.basename(file_path)
+        dest_path = os.path.join(dest_folder, filename)
         try:
+            self._move_without_overwrite(file_path, dest_path)
+            return dest_path
+        except FileExistsError:
+            pass
+
+        # Generate unique filename, adding timestamp to filename (and a
+        # counter if files with the same name are moved in the same second)
+        timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
+        name, ext = os.path.splitext(filename)
+        suffix = timestamp
+        counter = 0
+        while True:
+            dest_path = os.path.join(dest_folder, f"{name}_{suffix}{ext}")
+            try:
+                self._move_without_overwrite(file_path, dest_path)
+                return dest_path
+            except FileExistsError:
+                counter += 1
+                suffix = f"{timestamp}_{counter}"
+
+    @staticmethod
+    def _move_without_overwrite(file_path: str, dest_path: str) -> None:
+        """
+        Move file, raising FileExistsError if destination already exists.
+
+        Since os.rename overwrites destination, a hard link is created
+        (that fails atomically if destination exists) before removing
+        source file.
+        If hard links are not supported (for instance destination on
+        another device), the file is moved after checking destination.
+        """
+        try:
+            os.link(file_path, dest_path)
+        except OSError as e:
+            if e.errno not in LINK_UNSUPPORTED_ERRNOS:
+                raise
+            if os.path.exists(dest_path):
+                raise FileExistsError(
+                    errno.EEXIST, os.strerror(errno.EEXIST), dest_path
+                ) from e
             shutil.move(file_path, dest_path)
-            self.logger.debug(f"Moved {file_path} to {dest_path}")
-        except Exception as e:
-            self.logger.error(f"Failed to move file {file_path}: {e}")
+            return
+        try:
+            os.unlink(file_path)
+        except OSError:
+            # file must not be kept in both folders, otherwise it would be
+            # imported again
+            try:
+                os.unlink(dest_path)
+            except OSError:
+                pass
+            raise
+
+    def _ensure_directory(self, path: str) -> None:
+        """
+        Create directory if needed. Created directories are cached to avoid
+        a syscall on each move.
+        """
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
 
 
 class SinkFolderWatcher:
@@ -295,7 +614,8 @@ class SinkFolderWatcher:
     def __init__(self, app: "Flask", logger: Optional[Logger] = None):
         self.app = app
         self.logger = logger or appLog
-        self.observer: Optional[Observer] = None
+        self.observer: Optional["BaseObserver"] = None
+        self.event_handler: Optional[WorkoutFileHandler] = None
 
     def get_sink_folder_path(self) -> str:
         """Get the path to the sink folder."""
@@ -313,17 +633,20 @@ class SinkFolderWatcher:
         os.makedirs(os.path.join(sink_folder, PROCESSED_FOLDER_NAME), exist_ok=True)
         os.makedirs(os.path.join(sink_folder, ERROR_FOLDER_NAME), exist_ok=True)
 
-        self.logger.info(f"Sink folder initialized at: {sink_folder}")
+        self.logger.info("Sink folder initialized at: %s", sink_folder)
         self.logger.info(
-            f"Structure:\n"
-            f"  {sink_folder}/\n"
-            f"    ├── {{username}}/           # Place files here per user\n"
-            f"    │   └── {{sport_id}}/       # Optional: subfolder for sport\n"
-            f"    ├── {PROCESSED_FOLDER_NAME}/            # Successfully processed files\n"
-            f"    └── {ERROR_FOLDER_NAME}/                 # Failed files"
+            "Structure:\n"
+            "  %s/\n"
+            "    ├── {username}/           # Place files here per user\n"
+            "    │   └── {sport_id}/       # Optional: subfolder for sport\n"
+            "    ├── %s/            # Successfully processed files\n"
+            "    └── %s/                 # Failed files",
+            sink_folder,
+            PROCESSED_FOLDER_NAME,
+            ERROR_FOLDER_NAME,
         )
 
-    def start(self, recursive: bool = True) -> None:
+    def start(self) -> None:
         """Start watching the sink folder."""
         sink_folder = self.get_sink_folder_path()
 
@@ -331,20 +654,30 @@ class SinkFolderWatcher:
         self.setup_folders()
 
         # Create the event handler and observer
-        event_handler = WorkoutFileHandler(self.app, self.logger)
+        self.event_handler = WorkoutFileHandler(self.app, self.logger)
+        self.event_handler.start()
         self.observer = Observer()
-        self.observer.schedule(event_handler, sink_folder, recursive=recursive)
+        # a single recursive watch is used, since on Linux each scheduled
+        # watch opens its own inotify instance (limited by
+        # 'fs.inotify.max_user_instances'). Files in processed and error
+        # folders are ignored by the handler.
+        self.observer.schedule(self.event_handler, sink_folder, recursive=True)
 
-        self.logger.info(f"Starting sink folder watcher on: {sink_folder}")
+        self.logger.info("Starting sink folder watcher on: %s", sink_folder)
         self.observer.start()
 
     def stop(self) -> None:
         """Stop watching the sink folder."""
         if self.observer:
             self.logger.info("Stopping sink folder watcher...")
-            self.observer.stop()
-            self.observer.join()
+            # observer thread is not started when start has failed
+            if self.observer.is_alive():
+                self.observer.stop()
+                self.observer.join()
             self.observer = None
+        if self.event_handler:
+            self.event_handler.shutdown()
+            self.event_handler = None
 
     def run_forever(self) -> None:
         """Run the watcher until interrupted."""
@@ -358,6 +691,29 @@ class SinkFolderWatcher:
         finally:
             self.stop()
 
+    def _iter_workout_files(self, folder: str) -> Iterator[str]:
+        """
+        Yield workout files paths found in folder and its subfolders,
+        except processed and error folders.
+
+        os.scandir is used since entries types are returned by directory
+        listing, avoiding a stat call per entry.
+        """
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.warning("Failed to scan directory %s: %s", folder, e)
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in (PROCESSED_FOLDER_NAME, ERROR_FOLDER_NAME):
+                    continue
+                yield from self._iter_workout_files(entry.path)
+            elif entry.is_file() and _is_workout_file(entry.name):
+                yield entry.path
+
     def process_existing_files(self) -> int:
         """
         Process any existing files in the sink folder.
@@ -369,22 +725,13 @@ class SinkFolderWatcher:
         """
         sink_folder = self.get_sink_folder_path()
         handler = WorkoutFileHandler(self.app, self.logger)
-        count = 0
+        file_paths = []
 
         with self.app.app_context():
-            for root, dirs, files in os.walk(sink_folder):
-                # Skip processed and error folders
-                dirs[:] = [
-                    d for d in dirs
-                    if d not in [PROCESSED_FOLDER_NAME, ERROR_FOLDER_NAME]
-                ]
-
-                for filename in files:
-                    extension = Path(filename).suffix.lower().lstrip(".")
-                    if extension in WORKOUT_ALLOWED_EXTENSIONS:
-                        file_path = os.path.join(root, filename)
-                        self.logger.info(f"Processing existing file: {file_path}")
-                        handler._process_file(file_path)
-                        count += 1
-
-        return count
+            for file_path in self._iter_workout_files(sink_folder):
+                self.logger.info("Found existing file: %s", file_path)
+                file_paths.append(file_path)
+
+            handler._process_files(file_paths)
+
+        return len(file_paths)